@@ -0,0 +1,6 @@
+import sys, pathlib
+
+# Resolved once at import; insert first so the local src shadows any installed copy
+ROOT = str(pathlib.Path(__file__).resolve().parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
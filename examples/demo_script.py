@@ -1,18 +1,16 @@
-import sys, os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src import PullData, Buy, Sell, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs, CryptoMarketDisplay
+import asyncio
+import requests
+from pathlib import Path
+from src import CoinGeckoBase, PullData, AsyncPullData, Buy, Sell, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs, CryptoMarketDisplay
 
-dataPuller = PullData()
-display = CryptoMarketDisplay(dataPuller.get_market_data())
-market = MarketData()
-choice = int(input("How much funds do you have?\n"))
-portfo = Portfolio(choice)
+# Max requests in flight at once, keeps us under CoinGecko's rate limit
+CONCURRENCY_LIMIT = 5
+# Responses are kept here between demo runs
+CACHE_DIR = Path.home() / ".cache" / "pulldata"
+# Coins whose price history is warmed up at startup
+PREFETCH_COINS = ["bitcoin", "ethereum", "tether", "solana", "ripple"]
 
-
-display.menu()
-while(True):
-    choice = input(
-"""
+MAIN_PROMPT = """
 What do you want to do?
 1) View Charts
 2) View Table
@@ -21,88 +19,159 @@ What do you want to do?
 5) View Portfolio
 6) Exit
 """
-    )
-    if choice == "1":
-        if market.fetch_data(limit=50):
-            charts = Price_Charts_Graphs()
 
-            choice = input(
-"""
+CHART_PROMPT = """
 Which Chart do you want?
 1) Price Chart
 2) 24h Change Chart
 3) Nevermind
 """
-            )
-            while(True):
-                if choice == "1":
-                    print("\n * Generating Price Chart...")
-                    charts.create_price_chart(market, top_n=15)  # Pass market object, not data
-                    break
-                elif choice == "2":
-                    print("\n * Generating 24h Change Chart...")
-                    charts.create_changing_chart(market, top_n=15)  # Correct method name
-                    break
-                elif choice == "3":
-                    break
-                else:
-                    print("I didn't understand that.")
-    elif choice == "2":
-        display.display_market_data()
-    elif choice == "3":
-        while(True):
-            choice = input("What crypto do you want to buy? 1) Nevermind\n")
-            if choice == "1":
-                break
-            choice2 = int(input("How much crypto do you want to buy?\n"))
-            if choice2 <= 0:
-                print("Not Valid, Try again")
-                continue
-            try:
-                purchase = Buy(choice, dataPuller, choice2)
-                portfo.makeTransaction(purchase)
-                break
-            except:
-                print("I didn't understand what you wanted. Please try again")
-        print("Purchased!")
-    elif choice == "4":
-        while(True):
-            choice = input("What crypto do you want to sell? 1) Nevermind\n")
-            if choice == "1":
-                break
-            choice2 = int(input("How much crypto do you want to sell?\n"))
-            if choice2 <= 0:
-                print("Not Valid, Try again")
-                continue
-            try:
-                purchase = Sell(choice, dataPuller, choice2)
-                portfo.makeTransaction(purchase)
-                break
-            except:
-                print("I didn't understand what you wanted. Please try again")
-    elif choice == "5":
-        while(True):
-            choice = input(
-"""
+
+PORTFOLIO_PROMPT = """
 What would you like to see?
 1) Portfolio Holdings
 2) Portfolio Value
 3) Past Transactions
 4) Exit
 """
-            )
-            if choice == "1":
-                print(portfo.portfolioHoldings())
-            elif choice == "2":
-                print(portfo.seePortfolioValue())
-            elif choice == "3":
-                portfo.seePastTransactions()
-            elif choice == "4":
-                break
-            else:
-                print("I didn't understand that...")
-    elif choice == "6":
-        break
-    else:
-        print("I didn't understand that...")
-print("BYE!")
+
+
+class DemoContext:
+    """Objects shared by every menu handler"""
+
+    def __init__(self, dataPuller: PullData, display: CryptoMarketDisplay,
+                 market: MarketData, portfo: Portfolio, valid_ids: set):
+        self.dataPuller = dataPuller
+        self.display = display
+        self.market = market
+        self.portfo = portfo
+        # CoinGecko ids accepted by Buy/Sell, empty if the market fetch failed
+        self.valid_ids = valid_ids
+        self.running = True
+
+
+async def run_prefetch(coins: list):
+    """Fetch market data and the history of each coin concurrently"""
+    async with AsyncPullData(concurrency_limit=CONCURRENCY_LIMIT) as puller:
+        # Results land in the shared response cache, warming it for PullData
+        market_data, _ = await asyncio.gather(
+            puller.get_market_data(),
+            puller.get_many_historical(coins, days=7)
+        )
+    return market_data
+
+
+def _view_charts(ctx: DemoContext):
+    if not ctx.market.fetch_data(limit=50):
+        return
+    charts = Price_Charts_Graphs()
+
+    while(True):
+        chart_choice = input(CHART_PROMPT)
+        if chart_choice == "1":
+            print("\n * Generating Price Chart...")
+            charts.create_price_chart(ctx.market, top_n=15)  # Pass market object, not data
+        elif chart_choice == "2":
+            print("\n * Generating 24h Change Chart...")
+            charts.create_changing_chart(ctx.market, top_n=15)  # Correct method name
+        elif chart_choice == "3":
+            charts.close()
+            break
+        else:
+            print("I didn't understand that.")
+
+
+def _view_table(ctx: DemoContext):
+    # Served from PullData's cache until the market data goes stale
+    CryptoMarketDisplay(ctx.dataPuller.get_market_data()).display_market_data()
+
+
+def _read_positive_int(prompt: str, retries: int = 1):
+    """Read a positive whole number, allowing one retry; None if every try fails"""
+    for _ in range(retries + 1):
+        try:
+            amount = int(input(prompt))
+        except ValueError:
+            amount = 0
+        if amount > 0:
+            return amount
+        print("Not Valid, Try again")
+    return None
+
+
+def _trade(ctx: DemoContext, transaction_type, verb: str):
+    """Prompt once for a coin and amount, then record a Buy or Sell"""
+    coin = input(f"What crypto do you want to {verb}? 1) Nevermind\n")
+    if coin == "1":
+        return
+    if ctx.valid_ids and coin not in ctx.valid_ids:
+        print("Unknown coin, use its CoinGecko id (e.g. bitcoin)")
+        return
+    amount = _read_positive_int(f"How much crypto do you want to {verb}?\n")
+    if amount is None:
+        return
+    try:
+        print(ctx.portfo.makeTransaction(transaction_type(coin, ctx.dataPuller, amount)))
+    except (requests.RequestException, KeyError, ValueError) as e:
+        print(f"Couldn't price {coin} ({e}). Please try again")
+
+
+def _buy(ctx: DemoContext):
+    _trade(ctx, Buy, "buy")
+
+
+def _sell(ctx: DemoContext):
+    _trade(ctx, Sell, "sell")
+
+
+def _view_portfolio(ctx: DemoContext):
+    while(True):
+        portfolio_choice = input(PORTFOLIO_PROMPT)
+        if portfolio_choice == "1":
+            print(ctx.portfo.portfolioHoldings())
+        elif portfolio_choice == "2":
+            print(ctx.portfo.seePortfolioValue())
+        elif portfolio_choice == "3":
+            ctx.portfo.seePastTransactions()
+        elif portfolio_choice == "4":
+            break
+        else:
+            print("I didn't understand that...")
+
+
+def _exit(ctx: DemoContext):
+    ctx.running = False
+
+
+def _unknown(ctx: DemoContext):
+    print("I didn't understand that...")
+
+
+DISPATCH = {
+    "1": _view_charts,
+    "2": _view_table,
+    "3": _buy,
+    "4": _sell,
+    "5": _view_portfolio,
+    "6": _exit,
+}
+
+
+def main():
+    # Set on the shared base so PullData and AsyncPullData both use it
+    CoinGeckoBase.cache_dir = CACHE_DIR
+    dataPuller = PullData()
+    market_data = asyncio.run(run_prefetch(PREFETCH_COINS))
+    display = CryptoMarketDisplay(market_data)
+    valid_ids = set(market_data['id']) if not market_data.empty else set()
+    funds = int(input("How much funds do you have?\n"))
+    ctx = DemoContext(dataPuller, display, MarketData(), Portfolio(funds, dataPuller), valid_ids)
+
+    ctx.display.menu()
+    while ctx.running:
+        DISPATCH.get(input(MAIN_PROMPT), _unknown)(ctx)
+    print("BYE!")
+
+
+if __name__ == "__main__":
+    main()
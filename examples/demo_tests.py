@@ -1,19 +1,71 @@
-import sys, os
+import argparse
+import io
+import json
+import os
+import tempfile
 import unittest
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+import httpx
 import pandas as pd
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from src import PullData, Transaction, Buy, Sell, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs, CryptoMarketDisplay
+# Non-interactive backend, charts render without a display
+import matplotlib
+matplotlib.use('Agg', force=True)
+from src import CoinGeckoBase, PullData, AsyncPullData, Transaction, Buy, Sell, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs, CryptoMarketDisplay
 
-class TestPullData(unittest.TestCase):
+# Canned CoinGecko responses so unit tests never touch the network
+FIXTURES = Path(__file__).parent / "fixtures"
+MARKETS_FIXTURE = json.loads((FIXTURES / "coingecko_markets.json").read_text())
+PRICE_FIXTURE = {'bitcoin': {'usd': 67842.0}, 'ethereum': {'usd': 3831.1}}
+CHART_FIXTURE = {'prices': [[1712000000000, 67000.5], [1712003600000, 67250.0], [1712007200000, 67842.0]]}
+
+# Set COINGECKO_LIVE=1 to also run the tests that call the real API
+LIVE = os.environ.get("COINGECKO_LIVE") == "1"
+
+
+def mock_response(payload):
+    """A requests.Response stand-in returning payload"""
+    return Mock(status_code=200, content=json.dumps(payload).encode())
+
+
+def mock_transport():
+    """An httpx transport answering each CoinGecko endpoint with its fixture"""
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/coins/markets"):
+            return httpx.Response(200, json=MARKETS_FIXTURE)
+        if path.endswith("/simple/price"):
+            return httpx.Response(200, json=PRICE_FIXTURE)
+        if path.endswith("/market_chart"):
+            return httpx.Response(200, json=CHART_FIXTURE)
+        return httpx.Response(404)
+    return httpx.MockTransport(handler)
+
+
+def isolate_cache(test):
+    """Give a test an empty, memory-only PullData cache"""
+    for patcher in (patch.object(CoinGeckoBase, 'cache_dir', None),
+                    patch.object(CoinGeckoBase, '_memory_cache', OrderedDict())):
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+
+class TestPullData(unittest.IsolatedAsyncioTestCase):
     """
     Test suite for PullData class (William's Section)
     Test API data retrieval and formatting
     Status - (Testing - [DONE])
 
     """
+    @classmethod
+    def setUpClass(cls):
+        """Setting up one shared fixture for every test method"""
+        cls.puller = PullData()
+
     def setUp(self):
-        """Setting up fixtures before test method"""
-        self.puller = PullData()
+        isolate_cache(self)
 
     def test_pulldata_initial(self):
         """
@@ -22,47 +74,286 @@ class TestPullData(unittest.TestCase):
         self.assertIsNotNone(self.puller, "PullData should initialize")
         self.assertTrue(hasattr(self.puller, 'url'), "Should have a URL Attr")
 
-    def test_pulldata_market_data_retrieval(self):
+    async def test_pulldata_market_data_retrieval(self):
         """
-        Test: get_market_data() fetches from API
+        Test: AsyncPullData.get_market_data() fetches from API
         """
-        ans = self.puller.get_market_data(page=1)
+        async with httpx.AsyncClient(transport=mock_transport()) as client:
+            ans = await AsyncPullData(client).get_market_data(page=1)
 
         self.assertIsInstance(ans, pd.DataFrame, "Must return DataFrame")
+        self.assertEqual(len(ans), len(MARKETS_FIXTURE), "Must have a row per coin")
 
         # Checks that symbol & curr price have columns
-        if not ans.empty:
-            self.assertIn('symbol', ans.columns, "Must have symbol columns")
-            self.assertIn('current_price', ans.columns, "Myst have price columns")
+        self.assertIn('symbol', ans.columns, "Must have symbol columns")
+        self.assertIn('current_price', ans.columns, "Myst have price columns")
+        self.assertIn('change_24h', ans.columns, "Must rename the 24h change")
 
-    def test_pulldata_current_price_retrieval(self):
+    async def test_pulldata_current_price_retrieval(self):
         """
-        Test: get_current_price() fetches a specific crypto price
+        Test: AsyncPullData.get_current_price() fetches a specific crypto price
         """
-        curr_price = self.puller.get_current_price('bitcoin', 'ethereum')
+        async with httpx.AsyncClient(transport=mock_transport()) as client:
+            curr_price = await AsyncPullData(client).get_current_price(['bitcoin', 'ethereum'])
 
         self.assertIsInstance(curr_price, dict, "Must return dictionary")
 
         # Checks if price is positive
-        if 'bitcoin' in curr_price:
-            self.assertGreater(curr_price['bitcoin'], 0, "Bitcoin price must be non-negative")
+        self.assertGreater(curr_price['bitcoin'], 0, "Bitcoin price must be non-negative")
+        self.assertIn('ethereum', curr_price, "Must price every requested coin")
+
+    async def test_pulldata_history(self):
+        """
+        Test: AsyncPullData.get_historical_data() fetches price history
+        """
+        async with httpx.AsyncClient(transport=mock_transport()) as client:
+            ans = await AsyncPullData(client).get_historical_data('bitcoin', days=7)
+
+        self.assertIsInstance(ans, pd.DataFrame, "Must return DataFrame")
+        self.assertEqual(len(ans), len(CHART_FIXTURE['prices']), "Must have a row per sample")
+        self.assertIn('price', ans.columns, "Must have price columns")
+        self.assertIn('timestamp', ans.columns, "Myst have timestamp columns")
+        first_ms = CHART_FIXTURE['prices'][0][0]
+        self.assertEqual(ans['timestamp'].iloc[0], pd.Timestamp(first_ms, unit='ms'), "Must keep the timestamp")
+        self.assertEqual(ans['date'].iloc[0], ans['timestamp'].iloc[0].normalize(), "Date is the day of the sample")
+
+    async def test_pulldata_many_historical(self):
+        """
+        Test: get_many_historical() returns one history per coin and warms the cache
+        """
+        async with httpx.AsyncClient(transport=mock_transport()) as client:
+            histories = await AsyncPullData(client).get_many_historical(['bitcoin', 'ethereum'], days=7)
+
+        self.assertEqual(set(histories), {'bitcoin', 'ethereum'}, "Must key by coin id")
+        with patch.object(self.puller._session, 'get') as get:
+            cached = self.puller.get_historical_data('ethereum', days=7)
+        get.assert_not_called()
+        self.assertEqual(len(cached), len(CHART_FIXTURE['prices']), "Sync call reuses async result")
+
+    def test_pulldata_market_data_sync(self):
+        """
+        Test: get_market_data() parses the response of its pooled session
+        """
+        with patch.object(self.puller._session, 'get',
+                          return_value=mock_response(MARKETS_FIXTURE)) as get:
+            ans = self.puller.get_market_data(page=1)
+
+        get.assert_called_once()
+        self.assertEqual(list(ans['id']), [row['id'] for row in MARKETS_FIXTURE])
+        self.assertEqual(ans['current_price'].dtype, 'float64', "Prices keep full precision")
+        self.assertNotEqual(ans['id'].dtype, 'category', "Unique ids gain nothing as categories")
+        self.assertEqual(ans['symbol'].dtype, 'category', "Symbols should be categorical")
+
+    def test_pulldata_retries_after_429(self):
+        """
+        Test: a 429 is retried after the Retry-After delay
+        """
+        puller = PullData()
+        puller.rate_limit_delay = 0
+        limited = Mock(status_code=429, headers={'Retry-After': '0'})
+
+        with patch.object(puller._session, 'get',
+                          side_effect=[limited, mock_response(PRICE_FIXTURE)]) as get:
+            prices = puller.get_current_price(['bitcoin', 'ethereum'])
+
+        self.assertEqual(get.call_count, 2, "Should retry once after the 429")
+        self.assertEqual(prices['bitcoin'], 67842.0)
+
+    def test_pulldata_gives_up_after_max_retries(self):
+        """
+        Test: the last 429 is reported right away instead of sleeping first
+        """
+        puller = PullData()
+        puller.rate_limit_delay = 0
+        puller.max_retries = 2
+        limited = Mock(status_code=429, headers={'Retry-After': '5'})
+
+        with patch.object(puller._session, 'get', return_value=limited) as get, \
+             patch('src.api_library.time.sleep') as sleep:
+            self.assertIsNone(puller._make_request("simple/price"))
+
+        self.assertEqual(get.call_count, 3, "Should try max_retries + 1 times")
+        self.assertEqual(sleep.call_count, get.call_count - 1, "No sleep after the last attempt")
+
+    def test_async_puller_is_not_a_pulldata(self):
+        """
+        Test: AsyncPullData shares PullData's helpers but can't stand in for it
+        """
+        self.assertFalse(issubclass(AsyncPullData, PullData), "Async getters return coroutines")
+        self.assertTrue(issubclass(AsyncPullData, CoinGeckoBase))
+        self.assertFalse(hasattr(AsyncPullData(client=Mock()), '_session'), "No unused requests.Session")
+
+    async def test_async_retries_after_429(self):
+        """
+        Test: AsyncPullData retries a 429 too
+        """
+        responses = iter([httpx.Response(429, headers={'Retry-After': '0'}),
+                          httpx.Response(200, json=PRICE_FIXTURE)])
+        transport = httpx.MockTransport(lambda request: next(responses))
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            prices = await AsyncPullData(client).get_current_price(['bitcoin'])
+
+        self.assertEqual(prices['bitcoin'], 67842.0)
+
+    def test_pulldata_cache_reuses_response(self):
+        """
+        Test: repeated calls are served from the memory and disk caches
+        """
+        payload = {'bitcoin': {'usd': 50000}}
+        puller = PullData()
+
+        with tempfile.TemporaryDirectory() as tmp, \
+             patch.object(CoinGeckoBase, 'cache_dir', tmp), \
+             patch.object(PullData, '_make_request', return_value=payload) as request:
+            first = puller.get_current_price(['bitcoin'])
+            second = puller.get_current_price(['bitcoin'])
+            self.assertEqual(request.call_count, 1, "Second call should hit memory")
+
+            CoinGeckoBase._memory_cache.clear()
+            third = puller.get_current_price(['bitcoin'])
+            self.assertEqual(request.call_count, 1, "Should fall back to disk")
+
+        self.assertEqual(first, {'bitcoin': 50000})
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+
+    def test_pulldata_cache_removes_expired_file(self):
+        """
+        Test: an expired cache file is deleted when it is looked up
+        """
+        puller = PullData()
+
+        with tempfile.TemporaryDirectory() as tmp, \
+             patch.object(CoinGeckoBase, 'cache_dir', tmp), \
+             patch.object(PullData, '_make_request', return_value={'bitcoin': {'usd': 1}}) as request:
+            puller.get_current_price(['bitcoin'])
+            CoinGeckoBase._memory_cache.clear()
+            cached_file, = Path(tmp).iterdir()
+
+            # An hour later the lookup misses and the failed refetch isn't cached
+            request.return_value = {}
+            with patch('src.api_library.time.time', return_value=cached_file.stat().st_mtime + 3600):
+                puller.get_current_price(['bitcoin'])
+
+            self.assertFalse(cached_file.exists(), "Expired file should be removed")
+
+    def test_pulldata_details_cached(self):
+        """
+        Test: get_crypto_details() is cached, prices expire sooner
+        """
+        puller = PullData()
+        payload = {'id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin'}
+
+        with patch.object(PullData, '_make_request', return_value=payload) as request, \
+             patch('src.api_library.time.time', return_value=1000.0) as clock:
+            puller.get_crypto_details('bitcoin')
+            clock.return_value = 1100.0
+            details = puller.get_crypto_details('bitcoin')
+
+        self.assertEqual(request.call_count, 1, "Details should live for 5 minutes")
+        self.assertEqual(details['symbol'], 'BTC')
+
+    def test_pulldata_price_skips_missing_currency(self):
+        """
+        Test: coins without a quote in vs_currency are left out, not priced at 0
+        """
+        payload = {'bitcoin': {'usd': 50000}, 'newcoin': {}}
+
+        with patch.object(PullData, '_make_request', return_value=payload):
+            prices = PullData().get_current_price(['bitcoin', 'newcoin'])
+
+        self.assertEqual(prices, {'bitcoin': 50000})
+
+    def test_pulldata_price_batches(self):
+        """
+        Test: get_current_price() caps the ids sent per request
+        """
+        ids = [f"coin{i}" for i in range(65)]
+
+        with patch.object(PullData, '_make_request', return_value={}) as request:
+            PullData().get_current_price(ids)
 
-    def test_pulldata_history(self):
+        self.assertEqual(request.call_count, 3, "65 ids should take 3 requests")
+
+    def test_pulldata_market_data_arrays(self):
+        """
+        Test: get_market_data_arrays() returns one array per chart column
         """
-        Test: get_historical_data() fetches price history
+        payload = [
+            {'symbol': 'btc', 'current_price': 50000.0, 'price_change_percentage_24h': 2.5},
+            {'symbol': 'eth', 'current_price': None, 'price_change_percentage_24h': None},
+        ]
+
+        with patch.object(PullData, '_make_request', return_value=payload):
+            symbols, prices, changes = PullData().get_market_data_arrays()
+
+        self.assertEqual(list(symbols), ['btc', 'eth'])
+        self.assertEqual(prices.dtype, 'float64', "Prices must be float64")
+        self.assertEqual(list(prices), [50000.0, 0.0], "Missing price becomes 0")
+        self.assertEqual(list(changes), [2.5, 0.0], "Missing change becomes 0")
+
+    def test_pulldata_market_frame_and_arrays_share_request(self):
         """
+        Test: get_market_data() and get_market_data_arrays() share one response
+        """
+        puller = PullData()
+        with patch.object(puller._session, 'get',
+                          return_value=mock_response(MARKETS_FIXTURE)) as get:
+            frame = puller.get_market_data()
+            symbols, _, _ = puller.get_market_data_arrays()
+
+        get.assert_called_once()
+        self.assertEqual(list(symbols), list(frame['symbol']))
+
+
+@unittest.skipUnless(LIVE, "Set COINGECKO_LIVE=1 to call the real CoinGecko API")
+class TestPullDataLive(unittest.TestCase):
+    """
+    Integration tests against the live CoinGecko API, one per endpoint
+    """
+    def setUp(self):
+        isolate_cache(self)
+        self.puller = PullData()
+        self.addCleanup(self.puller.close)
+
+    def test_live_market_data(self):
+        """Live Test: coins/markets"""
+        ans = self.puller.get_market_data(page=1)
+
+        self.assertIsInstance(ans, pd.DataFrame, "Must return DataFrame")
+        if not ans.empty:
+            self.assertIn('current_price', ans.columns, "Must have price columns")
+
+    def test_live_current_price(self):
+        """Live Test: simple/price"""
+        curr_price = self.puller.get_current_price(['bitcoin'])
+
+        self.assertIsInstance(curr_price, dict, "Must return dictionary")
+        if 'bitcoin' in curr_price:
+            self.assertGreater(curr_price['bitcoin'], 0, "Bitcoin price must be non-negative")
+
+    def test_live_history(self):
+        """Live Test: coins/{id}/market_chart"""
         ans = self.puller.get_historical_data('bitcoin', days=7)
 
         self.assertIsInstance(ans, pd.DataFrame, "Must return DataFrame")
         if not ans.empty:
             self.assertIn('price', ans.columns, "Must have price columns")
-            self.assertIn('timestamp', ans.columns, "Myst have timestamp columns")
+
 
 class TestMarketData(unittest.TestCase):
     """
     Test suite for MarketData class (Christopher's Section)
     Status - (Testing - [DONE])
     """
+    @classmethod
+    def setUpClass(cls):
+        """Fetch the canned market data once for the I/O tests"""
+        cls.fetched_market = MarketData()
+        with patch.object(cls.fetched_market._session, 'get', return_value=mock_response(MARKETS_FIXTURE)):
+            cls.fetched = cls.fetched_market.fetch_data(limit=10)
+
     def setUp(self):
         self.market = MarketData()
 
@@ -89,13 +380,11 @@ class TestMarketData(unittest.TestCase):
         """
         I/O Test: Checking if fetch_data() gets all market Data
         """
-        ans = self.market.fetch_data(limit=10)
-
-        if ans:
-            self.assertTrue(ans, "Should return True if successful with fetch")
-            self.assertFalse(self.market.data.empty, "Must have data")
-        else:
-            self.skipTest("Unable to fetch API")
+        self.assertTrue(self.fetched, "Should return True if successful with fetch")
+        self.assertFalse(self.fetched_market.data.empty, "Must have data")
+        self.assertEqual(len(self.fetched_market.data), len(MARKETS_FIXTURE), "Must keep every coin")
+        self.assertEqual(self.fetched_market.data['current_price'].dtype, 'float64', "Prices keep full precision")
+        self.assertEqual(self.fetched_market.data['volume_24h'].dtype, 'float32', "Volumes should be downcast")
     
     def test_marketdata_limit(self):
         """
@@ -114,12 +403,24 @@ class TestMarketData(unittest.TestCase):
         Test: Update timestamp to be tracked
         """
         self.assertIsNone(self.market.previous_update, "Must be none before fetch")
+        self.assertIsNotNone(self.fetched_market.previous_update, "Must have a timestamp after fetch")
+        
+    def test_marketdata_fetch_reuses_fresh_data(self):
+        """
+        Test: fetch_data() skips the API while data is fresh, until invalidate()
+        """
+        with patch.object(self.market._session, 'get', return_value=mock_response(MARKETS_FIXTURE)) as get:
+            self.assertTrue(self.market.fetch_data(limit=10))
+            self.assertTrue(self.market.fetch_data(limit=5))
+            self.assertEqual(get.call_count, 1, "Fresh data covering the limit is reused")
 
-        ans = self.market.fetch_data(limit=10)
+            self.market.fetch_data(limit=20)
+            self.assertEqual(get.call_count, 2, "A larger limit needs a new fetch")
+
+            self.market.invalidate()
+            self.market.fetch_data(limit=5)
+            self.assertEqual(get.call_count, 3, "invalidate() forces a refetch")
 
-        if ans:
-            self.assertIsNotNone(self.market.previous_update, "Must have a timestamp after fetch")
-        
     def test_marketdata_lookup_valid(self):
         """
         Test: get_crypto_price() has a vaild input
@@ -130,6 +431,41 @@ class TestMarketData(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.market.get_crypto_price(" ")
 
+    def test_marketdata_display_top(self):
+        """
+        Test: display_top() writes header, one line per coin and a closing rule
+        """
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.fetched_market.display_top(limit=3)
+
+        lines = out.getvalue().strip("\n").splitlines()
+        self.assertEqual(len(lines), 6, "Header, rule, 3 coins, rule")
+        self.assertIn("BTC", lines[2])
+
+    def test_marketdata_display_top_missing_change(self):
+        """
+        Test: display_top() shows a missing 24h change as N/A, like CryptoMarketDisplay
+        """
+        rows = [dict(MARKETS_FIXTURE[0], price_change_percentage_24h=None)]
+        market = MarketData()
+        with patch.object(market._session, 'get', return_value=mock_response(rows)):
+            market.fetch_data(limit=1)
+
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            market.display_top(limit=1)
+
+        self.assertIn("N/A", out.getvalue())
+        self.assertNotIn("nan", out.getvalue())
+
+    def test_marketdata_lookup_price(self):
+        """
+        Test: get_crypto_price() finds a fetched coin by symbol, any case
+        """
+        btc = next(row for row in MARKETS_FIXTURE if row['symbol'] == 'btc')
+        self.assertEqual(self.fetched_market.get_crypto_price(" BTC "), btc['current_price'])
+        self.assertIsNone(self.fetched_market.get_crypto_price("notacoin"))
+        self.assertIsNone(self.market.get_crypto_price("btc"), "Nothing fetched yet")
+
 
 class TestCryptoMarketDisplay(unittest.TestCase):
     """
@@ -168,6 +504,27 @@ class TestCryptoMarketDisplay(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             CryptoMarketDisplay(None)
+
+    def test_display_summary_skips_nan(self):
+        """Test: summarize_market_performance() ignores missing changes"""
+        data = self.sample_data.assign(change_24h=[float('nan'), -1.2])
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            CryptoMarketDisplay(data).summarize_market_performance()
+            CryptoMarketDisplay(data.assign(change_24h=float('nan'))).summarize_market_performance()
+
+        text = out.getvalue()
+        self.assertIn("Top Gainer: Ethereum", text)
+        self.assertIn("No 24h changes available", text)
+
+    def test_display_market_data_rows(self):
+        """Test: display_market_data() prints one colored line per coin"""
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            CryptoMarketDisplay(self.sample_data).display_market_data()
+
+        lines = out.getvalue().splitlines()
+        self.assertIn("BTC", lines[-2])
+        self.assertIn("▲ +2.50%", lines[-2])
+        self.assertIn("▼ -1.20%", lines[-1])
     
 
 
@@ -198,6 +555,51 @@ class TestPortfolio(unittest.TestCase):
         
         self.assertEqual(funds, 10000.00, "Should return current funds")
 
+    def test_portfolio_value_single_price_lookup(self):
+        """Test: seePortfolioValue() prices every holding in one call"""
+        prices = {'bitcoin': 100.0, 'ethereum': 10.0}
+
+        puller = Mock()
+        puller.get_current_price.return_value = prices
+        portfolio = Portfolio(10000, puller)
+        portfolio.makeTransaction(Buy('bitcoin', puller, 2))
+        portfolio.makeTransaction(Buy('ethereum', puller, 3))
+        puller.get_current_price.reset_mock()
+        value = portfolio.seePortfolioValue()
+
+        puller.get_current_price.assert_called_once()  # Should batch on the shared puller
+        self.assertEqual(value, 230.0, "Should sum amount * price")
+
+    def test_portfolio_holdings_tracking(self):
+        """Persistence Test: portfolioHoldings() follows buys and sells"""
+        prices = {'bitcoin': 100.0, 'ethereum': 10.0}
+        with patch.object(PullData, 'get_current_price', return_value=prices):
+            puller = PullData()
+            self.portfolio.makeTransaction(Buy('bitcoin', puller, 5))
+            self.portfolio.makeTransaction(Sell('bitcoin', puller, 2))
+            refused = self.portfolio.makeTransaction(Sell('bitcoin', puller, 10))
+            never_owned = self.portfolio.makeTransaction(Sell('ethereum', puller, 1))
+
+        self.assertEqual(self.portfolio.portfolioHoldings(), {'bitcoin': 3}, "Should net buys and sells")
+        self.assertNotEqual(refused, "Success", "Can't sell more than owned")
+        self.assertNotEqual(never_owned, "Success", "Can't sell a coin never bought")
+        self.assertEqual(self.portfolio.seeCurrentFunds(), 9700.0, "Refused sales keep funds")
+
+    def test_portfolio_past_transactions(self):
+        """Test: seePastTransactions() prints one line per transaction"""
+        puller = Mock()
+        puller.get_current_price.return_value = {'bitcoin': 100.0}
+        self.portfolio.makeTransaction(Buy('bitcoin', puller, 2))
+        self.portfolio.makeTransaction(Sell('bitcoin', puller, 1))
+
+        with patch('sys.stdout', new_callable=io.StringIO) as out:
+            self.portfolio.seePastTransactions()
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2, "Should list both transactions")
+        self.assertTrue(lines[0].startswith("Buy(bitcoin, amount=2"))
+        self.assertTrue(lines[1].startswith("Sell(bitcoin, amount=1"))
+
     def test_portfolio_see_value_empty(self):
         """Test: seePortfolioValue() handles empty portfolio"""
         value = self.portfolio.seePortfolioValue()
@@ -222,6 +624,33 @@ class TestTransactions(unittest.TestCase):
         """Test: Transaction is abstract base"""
         self.assertTrue(hasattr(Transaction, 'value'), "Transaction should have value method")
 
+    def test_bulk_single_price_lookup(self):
+        """Test: bulk() prices every transaction with one call"""
+        puller = Mock()
+        puller.get_current_price.return_value = {'bitcoin': 100.0, 'ethereum': 10.0}
+        buys = Buy.bulk([('bitcoin', 2), ('ethereum', 3), ('bitcoin', 1)], puller)
+
+        puller.get_current_price.assert_called_once_with(['bitcoin', 'ethereum'])
+        self.assertEqual([type(b) for b in buys], [Buy, Buy, Buy])
+        self.assertEqual(sum(b.value() for b in buys), -330.0)
+
+    def test_bulk_rejects_base_class(self):
+        """Test: Transaction is abstract, so Transaction.bulk() can't build one"""
+        puller = Mock()
+        puller.get_current_price.return_value = {'bitcoin': 100.0}
+        with self.assertRaises(TypeError):
+            Transaction.bulk([('bitcoin', 1)], puller)
+
+        with self.assertRaises(TypeError):
+            Transaction('bitcoin', puller, 1)
+
+    def test_signed_amount(self):
+        """Test: Buy adds to holdings and Sell subtracts"""
+        puller = Mock()
+        puller.get_current_price.return_value = {'bitcoin': 100.0}
+        self.assertEqual(Buy('bitcoin', puller, 3).signed_amount(), 3)
+        self.assertEqual(Sell('bitcoin', puller, 3).signed_amount(), -3)
+
 class TestPriceChartsGraphs(unittest.TestCase):
     """
     Test suiter for Price_Charts_Graphs class (Christopher's Section)
@@ -229,10 +658,17 @@ class TestPriceChartsGraphs(unittest.TestCase):
     Status - (Testing - [DONE])
     """
 
-    def setUp(self):
-        """Set up test features"""
-        self.charts = Price_Charts_Graphs()
-        self.market = MarketData()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test features, fetching market data only once"""
+        cls.charts = Price_Charts_Graphs()
+        cls.market = MarketData()
+        with patch.object(cls.market._session, 'get', return_value=mock_response(MARKETS_FIXTURE)):
+            cls.fetched = cls.market.fetch_data(limit=10)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.charts.close()
 
     def test_charts_initial(self):
         """Test: Price_Charts_Graphs initializes properly"""
@@ -240,14 +676,19 @@ class TestPriceChartsGraphs(unittest.TestCase):
 
     def test_charts_price_chart_generation(self):
         """I/O Test: create_price_chart() generates chart"""
-        ans = self.market.fetch_data(limit=10)
-
-        if ans:
-            chart_results= self.charts.create_price_chart(self.market, top_n=5)
-            self.assertTrue(chart_results, "Charts should be created")
-        else:
-            # Skips Test if failed to Generate
-            self.skipTest("Cannot test without any data")
+        self.assertTrue(self.fetched, "Canned market data should load")
+
+        chart_results= self.charts.create_price_chart(self.market, top_n=5)
+        self.assertTrue(chart_results, "Charts should be created")
+
+    def test_charts_reuse_figure(self):
+        """Test: consecutive charts draw on the same Figure"""
+        self.assertTrue(self.charts.create_price_chart(self.market, top_n=5))
+        first = self.charts._fig
+        self.assertTrue(self.charts.create_changing_chart(self.market, top_n=5))
+
+        self.assertIs(self.charts._fig, first, "Figure should be reused")
+        self.assertEqual(len(self.charts._ax.patches), 5, "Old bars should be cleared")
     
     def test_charts_type(self):
         """Test: Chart methods are valid with input type"""
@@ -264,32 +705,79 @@ class TestPriceChartsGraphs(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.charts.create_price_chart(self.market, top_n=100)
 
+        # Same bounds for the 24h change chart
+        with self.assertRaises(ValueError):
+            self.charts.create_changing_chart(self.market, top_n=0)
+
+        with self.assertRaises(ValueError):
+            self.charts.create_changing_chart(self.market, top_n=100)
 
 
-def main():
-    # Creating test suites for all test classes
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Adding All test class to loadTestsFromTestCase()
-    suite.addTest(loader.loadTestsFromTestCase(TestPullData))
-    suite.addTest(loader.loadTestsFromTestCase(TestPriceChartsGraphs))
-    suite.addTest(loader.loadTestsFromTestCase(TestMarketData))
-    suite.addTest(loader.loadTestsFromTestCase(TestCryptoMarketDisplay))
-    suite.addTest(loader.loadTestsFromTestCase(TestPortfolio))
-    suite.addTest(loader.loadTestsFromTestCase(TestTransactions))
-
-    # Running tests 
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+
+# Test classes that never touch the network
+QUICK_SUITE = [TestPullData, TestPriceChartsGraphs, TestMarketData,
+               TestCryptoMarketDisplay, TestPortfolio, TestTransactions]
+FULL_SUITE = [TestPullData, TestPullDataLive, TestPriceChartsGraphs, TestMarketData,
+              TestCryptoMarketDisplay, TestPortfolio, TestTransactions]
+
+
+def run_test_class(name: str):
+    """
+    Run one test class and report back (entry point of the worker processes)
+
+    Returns:
+        Tuple of (runner output, tests run, failures, errors)
+    """
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return stream.getvalue(), result.testsRun, len(result.failures), len(result.errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the project test suite")
+    parser.add_argument("--quick", action="store_true",
+                        help="only run the tests that don't call the CoinGecko API")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="run test classes in this many worker processes (0 = one per CPU)")
+    args = parser.parse_args(argv)
+
+    test_classes = QUICK_SUITE if args.quick else FULL_SUITE
+    jobs = args.jobs or os.cpu_count()
+
+    if jobs > 1:
+        # Each class runs in its own process with its own PullData session,
+        # so the blocking calls of one class overlap with the others
+        names = [test_class.__name__ for test_class in test_classes]
+        with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+            reports = list(pool.map(run_test_class, names))
+
+        for output, *_ in reports:
+            print(output, end="")
+        tests_run = sum(report[1] for report in reports)
+        failures = sum(report[2] for report in reports)
+        errors = sum(report[3] for report in reports)
+    else:
+        # Creating test suites for all test classes
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite()
+        
+        # Adding All test class to loadTestsFromTestCase()
+        for test_class in test_classes:
+            suite.addTest(loader.loadTestsFromTestCase(test_class))
+
+        # Running tests 
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        tests_run, failures, errors = result.testsRun, len(result.failures), len(result.errors)
 
     print("\n" + "="*70)
     print("COMPLETE TEST SUITE SUMMARY")
     print("="*70)
-    print(f"Total Tests: {result.testsRun}")
-    print(f"Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failed: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
+    print(f"Total Tests: {tests_run}")
+    print(f"Passed: {tests_run - failures - errors}")
+    print(f"Failed: {failures}")
+    print(f"Errors: {errors}")
     print("="*70)
     print("\nTEST COVERAGE BY COMPONENT:")
     print("- PullData (William): API data retrieval")
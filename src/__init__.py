@@ -1,4 +1,3 @@
-import sys, os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from api_library import PullData, Buy, Sell, Transaction, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs
-from utils import CryptoMarketDisplay
+from .api_library import CoinGeckoBase, PullData, Buy, Sell, Transaction, Portfolio, MarketData, Portfolio_Helper, Price_Charts_Graphs
+from .async_api import AsyncPullData
+from .utils import CryptoMarketDisplay
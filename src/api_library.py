@@ -1,93 +1,195 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+import functools
+import hashlib
+import inspect
+import pickle
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson
+except ImportError:
+    # Stdlib fallback, slower but its loads() also accepts bytes
+    import json as orjson
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import time
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import unittest
 
-class PullData:
+from .utils import downcast, format_change, RESET, TOP_HEADER, TOP_SEPARATOR
+
+def _is_empty(value) -> bool:
+    """True for results that mean the request failed and shouldn't be cached"""
+    if isinstance(value, pd.DataFrame):
+        return value.empty
+    if isinstance(value, tuple):
+        return all(len(column) == 0 for column in value)
+    return not value
+
+
+def _copy(value):
+    """Copy a cached result so callers can't mutate the cache"""
+    if isinstance(value, tuple):
+        return tuple(column.copy() for column in value)
+    return value.copy()
+
+
+def _cached(ttl: float):
     """
-    Class for fetching and processing data from CoinGecko API
-    Work by William
+    Cache a PullData method's result in memory and on disk for ttl seconds
+
+    Entries are keyed by method name and arguments, so AsyncPullData's
+    coroutines share them with PullData. Empty results are never cached.
+
+    Args:
+        ttl: Seconds a cached result stays fresh
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        name = func.__name__
+
+        def make_key(self, args, kwargs) -> str:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            items = [(k, tuple(v) if isinstance(v, list) else v)
+                     for k, v in bound.arguments.items() if k != "self"]
+            return repr((name, items))
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = make_key(self, args, kwargs)
+                hit = self._cache_lookup(key, ttl)
+                if hit is not None:
+                    return hit
+                return self._cache_store(key, await func(self, *args, **kwargs))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(self, args, kwargs)
+            hit = self._cache_lookup(key, ttl)
+            if hit is not None:
+                return hit
+            return self._cache_store(key, func(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def _build_session(max_retries: int) -> requests.Session:
     """
+    Create a keep-alive session so repeated calls reuse the TCP/TLS connection
+
+    Gateway errors are retried with backoff here, 429s are left to the
+    caller's own rate limiting.
+
+    Args:
+        max_retries: Retries per request before giving up
+    """
+    retry = Retry(total=max_retries, backoff_factor=0.3,
+                  status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class CoinGeckoBase:
+    """
+    Settings, response cache and request/parse helpers shared by PullData
+    and AsyncPullData
+
+    Holds no getters itself, so a sync and an async client never stand in
+    for each other.
+    """
+
+    # In-memory tier of the response cache, shared by every client
+    _memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
+    _memory_cache_size = 256
+    # On-disk tier of the response cache, off unless set to a directory
+    cache_dir: Optional[Path] = None
 
     def __init__(self):
         self.url = "https://api.coingecko.com/api/v3"
-        self.last_request_time = 0
         self.rate_limit_delay = 10.0
         self.max_retries = 5
+        # CoinGecko splits larger simple/price lookups on its side
+        self.max_ids_per_request = 30
 
-    def _rate_limit(self):
-        """Ensure we don't exceed API rate limits"""
-        while True:
-            # Enforce minimum time between requests
-            now = time.time()
-            elapsed = now - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - elapsed)
-
-            # Attempt request once caller executes
-            self.last_request_time = time.time()
-
-            # After caller executes the actual request, check response
-            # We can monkey-patch requests.get temporarily to inject retry handling
-            original_get = requests.get
-
-            def limited_get(*args, **kwargs):
-                retries = 0
-                while True:
-                    resp = original_get(*args, **kwargs)
-                    if resp.status_code == 429:  # Too Many Requests
-                        retry_after = resp.headers.get("Retry-After")
-                        if retry_after:
-                            wait = float(retry_after)
-                        else:
-                            wait = self.rate_limit_delay * (2 ** retries)
-                        print(f"429 received — retrying in {wait:.1f}s...")
-                        time.sleep(wait)
-                        retries += 1
-                        if retries > self.max_retries:
-                            raise RuntimeError("Exceeded retry limit after rate limiting")
-                        continue
-                    return resp
-
-            requests.get = limited_get
-            return
-
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """
-        Make a rate-limited request to the API
-        
-        Args:
-            endpoint: API endpoint path
-            params: Query parameters
-            
-        Returns:
-            JSON response as dictionary
-        """
-        self._rate_limit()
-        url = f"{self.url}/{endpoint}"
+    def _retry_wait(self, response, attempt: int) -> float:
+        """Seconds to wait after a 429, from Retry-After or exponential backoff"""
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"API request failed: {e}")
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return self.rate_limit_delay * (2 ** attempt)
+
+    def _cache_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
             return None
-        
-    def get_market_data(self, page: int = 1) -> pd.DataFrame:
+        return Path(self.cache_dir) / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+    def _remember(self, key: str, stored_at: float, value):
+        """Put a value in the in-memory tier, evicting the oldest entry if full"""
+        cache = self._memory_cache
+        cache[key] = (stored_at, value)
+        cache.move_to_end(key)
+        while len(cache) > self._memory_cache_size:
+            cache.popitem(last=False)
+
+    def _cache_lookup(self, key: str, ttl: float):
         """
-        Get current market data for multiple cryptocurrencies
-        
-        Args:
-            page: Page number
-            
+        Find a fresh cached result, checking memory first and then disk
+
         Returns:
-            DataFrame with market data
+            A copy of the cached value, or None on a miss
         """
-        params = {
+        now = time.time()
+        entry = self._memory_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            self._memory_cache.move_to_end(key)
+            return _copy(entry[1])
+
+        path = self._cache_path(key)
+        try:
+            if path is not None and path.exists():
+                stored_at = path.stat().st_mtime
+                if now - stored_at >= ttl:
+                    # Expired, remove it so the directory doesn't keep growing
+                    path.unlink()
+                    return None
+                value = pd.read_pickle(path)
+                self._remember(key, stored_at, value)
+                return _copy(value)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # An unreadable cache file is just a miss
+            pass
+        return None
+
+    def _cache_store(self, key: str, value):
+        """Save a non-empty result to both cache tiers and return it"""
+        if _is_empty(value):
+            return value
+
+        self._remember(key, time.time(), _copy(value))
+        path = self._cache_path(key)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                pd.to_pickle(value, path)
+            except OSError as e:
+                print(f"Could not write cache file: {e}")
+        return value
+
+    @staticmethod
+    def _market_params(page: int) -> Dict:
+        return {
             "vs_currency": 'usd',
             "order": "market_cap_desc",
             "per_page": 100,
@@ -95,9 +197,9 @@ class PullData:
             "sparkline": False,
             "price_change_percentage": "24h,7d"
         }
-        
-        data = self._make_request("coins/markets", params)
 
+    @staticmethod
+    def _parse_market_data(data) -> pd.DataFrame:
         if not data:
             return pd.DataFrame()
         
@@ -115,20 +217,25 @@ class PullData:
             'price_change_percentage_7d_in_currency': 'change_7d'
         })
         
-        return df
-    
-    def get_crypto_details(self, crypto_id: str) -> Dict:
-        """
-        Get detailed information about a specific cryptocurrency
-        
-        Args:
-            crypto_id: CoinGecko ID (e.g., 'bitcoin', 'ethereum')
-            
-        Returns:
-            Dictionary with crypto details including description
-        """
-        data = self._make_request(f"coins/{crypto_id}")
-        
+        return downcast(df)
+
+    @staticmethod
+    def _parse_market_arrays(data):
+        n = len(data) if data else 0
+        symbols = np.empty(n, dtype=object)
+        prices = np.empty(n, dtype=np.float64)
+        change_24h = np.empty(n, dtype=np.float64)
+
+        # One pass over the JSON rows straight into the preallocated columns
+        for i, row in enumerate(data or ()):
+            symbols[i] = row['symbol']
+            prices[i] = row.get('current_price') or 0.0
+            change_24h[i] = row.get('price_change_percentage_24h') or 0.0
+
+        return symbols, prices, change_24h
+
+    @staticmethod
+    def _parse_crypto_details(data) -> Dict:
         if not data:
             return {}
         
@@ -148,7 +255,177 @@ class PullData:
         }
         
         return details
-    
+
+    @staticmethod
+    def _historical_params(days: int) -> Dict:
+        return {
+            "vs_currency": 'usd',
+            "days": days
+        }
+
+    @staticmethod
+    def _parse_historical_data(data) -> pd.DataFrame:
+        if not data or 'prices' not in data:
+            return pd.DataFrame()
+        
+        # One float64 block for the [ms, price] pairs, then one column per slice
+        samples = np.asarray(data['prices'], dtype=np.float64).reshape(-1, 2)
+        # Epoch milliseconds reinterpreted as datetimes, no per-row parsing
+        timestamps = samples[:, 0].astype(np.int64).view('datetime64[ms]').astype('datetime64[ns]')
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'price': samples[:, 1],
+            # Day of each sample, kept as a datetime64 instead of date objects
+            'date': timestamps.astype('datetime64[D]')
+        }, copy=False)
+        
+        return df
+
+    @staticmethod
+    def _parse_current_price(data, vs_currency: str) -> Dict:
+        if not data:
+            return {}
+        
+        # Flatten the nested structure, coins not quoted in vs_currency are left out
+        prices = {crypto_id: info[vs_currency]
+                  for crypto_id, info in data.items() if vs_currency in info}
+        
+        return prices
+
+    @staticmethod
+    def _price_params(crypto_ids: List[str], vs_currency: str) -> Dict:
+        return {
+            "ids": ",".join(crypto_ids),
+            "vs_currencies": vs_currency
+        }
+
+    def _price_batches(self, crypto_ids: List[str]) -> List[List[str]]:
+        """Split ids into groups small enough for one simple/price request"""
+        if isinstance(crypto_ids, str):
+            crypto_ids = [crypto_ids]
+        size = self.max_ids_per_request
+        return [list(crypto_ids[i:i + size]) for i in range(0, len(crypto_ids), size)]
+
+
+class PullData(CoinGeckoBase):
+    """
+    Class for fetching and processing data from CoinGecko API
+    Work by William
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.last_request_time = 0
+
+        self._session = _build_session(self.max_retries)
+
+    def _rate_limit(self):
+        """Ensure we don't exceed API rate limits"""
+        # Enforce minimum time between requests
+        now = time.time()
+        elapsed = now - self.last_request_time
+        if elapsed < self.rate_limit_delay:
+            time.sleep(self.rate_limit_delay - elapsed)
+
+        self.last_request_time = time.time()
+
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
+        """
+        Make a rate-limited request to the API
+
+        429 responses are retried up to max_retries times.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            
+        Returns:
+            JSON response as dictionary
+        """
+        url = f"{self.url}/{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            self._rate_limit()
+            try:
+                response = self._session.get(url, params=params, timeout=10)
+                if response.status_code == 429:  # Too Many Requests
+                    if attempt == self.max_retries:
+                        break
+                    wait = self._retry_wait(response, attempt)
+                    print(f"429 received — retrying in {wait:.1f}s...")
+                    time.sleep(wait)
+                    continue
+                response.raise_for_status()
+                # Parse the raw bytes, skipping requests' encoding detection
+                return orjson.loads(response.content)
+            except requests.exceptions.RequestException as e:
+                print(f"API request failed: {e}")
+                return None
+            except ValueError as e:
+                print(f"API returned invalid JSON: {e}")
+                return None
+
+        print("Exceeded retry limit after rate limiting")
+        return None
+
+    @_cached(ttl=60)
+    def _market_rows(self, page: int = 1) -> List[Dict]:
+        """Raw coins/markets rows, cached once for both market getters"""
+        return self._make_request("coins/markets", self._market_params(page))
+
+    def get_market_data(self, page: int = 1) -> pd.DataFrame:
+        """
+        Get current market data for multiple cryptocurrencies
+        
+        Args:
+            page: Page number
+            
+        Returns:
+            DataFrame with market data
+        """
+        return self._parse_market_data(self._market_rows(page))
+
+    def get_market_data_arrays(self, page: int = 1):
+        """
+        Get the chart columns of the market data as NumPy arrays
+
+        Skips building a full DataFrame when only symbols and prices are needed,
+        and shares its cached response with get_market_data(). Missing prices
+        or changes are reported as 0.0. Public helper, nothing in this package
+        calls it yet.
+
+        Args:
+            page: Page number
+
+        Returns:
+            Tuple of (symbols, prices, change_24h) arrays
+        """
+        return self._parse_market_arrays(self._market_rows(page))
+
+    @_cached(ttl=300)
+    def get_crypto_details(self, crypto_id: str) -> Dict:
+        """
+        Get detailed information about a specific cryptocurrency
+        
+        Args:
+            crypto_id: CoinGecko ID (e.g., 'bitcoin', 'ethereum')
+            
+        Returns:
+            Dictionary with crypto details including description
+        """
+        data = self._make_request(f"coins/{crypto_id}")
+        return self._parse_crypto_details(data)
+
+    @_cached(ttl=3600)
     def get_historical_data(self, crypto_id: str, days: int = 30) -> pd.DataFrame:
         """
         Get historical price data for a cryptocurrency
@@ -160,26 +437,15 @@ class PullData:
         Returns:
             DataFrame with timestamp and price columns
         """
-        params = {
-            "vs_currency": 'usd',
-            "days": days
-        }
-        
-        data = self._make_request(f"coins/{crypto_id}/market_chart", params)
-        
-        if not data or 'prices' not in data:
-            return pd.DataFrame()
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data['prices'], columns=['timestamp', 'price'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df['date'] = df['timestamp'].dt.date
-        
-        return df
-    
+        data = self._make_request(f"coins/{crypto_id}/market_chart", self._historical_params(days))
+        return self._parse_historical_data(data)
+
+    @_cached(ttl=30)
     def get_current_price(self, crypto_ids: List[str], vs_currency: str = "usd") -> Dict:
         """
         Get current prices for multiple cryptocurrencies
+
+        Ids are sent in batches of max_ids_per_request, one request each.
         
         Args:
             crypto_ids: List of CoinGecko IDs
@@ -188,32 +454,49 @@ class PullData:
         Returns:
             Dictionary mapping crypto_id to price
         """
-        params = {
-            "ids": ",".join(crypto_ids),
-            "vs_currencies": vs_currency
-        }
-        
-        data = self._make_request("simple/price", params)
-        if not data:
-            return {}
-        
-        # Flatten the nested structure
-        prices = {crypto_id: info.get(vs_currency, 0) 
-                 for crypto_id, info in data.items()}
-        
+        prices = {}
+        for batch in self._price_batches(crypto_ids):
+            data = self._make_request("simple/price", self._price_params(batch, vs_currency))
+            prices.update(self._parse_current_price(data, vs_currency))
         return prices
 
-class Transaction:
-    def __init__(self, crypto_id: str, datapuller: PullData, amount: int):
+class Transaction(ABC):
+    def __init__(self, crypto_id: str, datapuller: PullData, amount: int,
+                 price: Optional[float] = None):
+        # Look up the current price unless the caller already has it
+        if price is None:
+            price = datapuller.get_current_price([crypto_id])[crypto_id]
+        self.pointPrice = price
         self.crypto_id = crypto_id
         self.datapuller = datapuller
         self.amount = amount
         self._timestamp = datetime.now()
 
+    @classmethod
+    def bulk(cls, ids_amounts: List[tuple], datapuller: PullData) -> list:
+        """
+        Create several transactions from one batched price lookup
+
+        Args:
+            ids_amounts: (crypto_id, amount) pairs
+            datapuller: PullData used for the lookup
+
+        Returns:
+            List of transactions in the same order as ids_amounts
+        """
+        ids_amounts = list(ids_amounts)
+        prices = datapuller.get_current_price(list(dict.fromkeys(coin for coin, _ in ids_amounts)))
+        return [cls(coin, datapuller, amount, price=prices[coin]) for coin, amount in ids_amounts]
+
     @abstractmethod
     def value(self):
         pass
 
+    @abstractmethod
+    def signed_amount(self):
+        """Change to the amount held, positive when coins are gained"""
+        pass
+
     def name(self):
         return self.crypto_id
 
@@ -221,46 +504,48 @@ class Transaction:
         return self.amount
     
     def __str__(self):
-        return f"Transaction({self.crypto_id}, amount={self._amount} at {self._timestamp}"
+        return self.__repr__()
 
     def __repr__(self):
-        return f"Transaction({self.crypto_id}, amount={self._amount} at {self._timestamp}"
+        return f"{type(self).__name__}({self.crypto_id}, amount={self.amount} at {self._timestamp})"
 
 class Buy(Transaction):
-    def __init__(self, crypto_id: str, datapuller: PullData, amount: int):
-        price_data = datapuller.get_current_price([crypto_id])
-        self.pointPrice = price_data[crypto_id]
-        super().__init__(crypto_id, datapuller, amount)
-
     def value(self):
         return -1 * self.amount * self.pointPrice
 
-class Sell(Transaction):
-    def __init__(self, crypto_id: str, datapuller: PullData, amount: int):
-        price_data = datapuller.get_current_price([crypto_id])
-        self.pointPrice = price_data[crypto_id]
-        super().__init__(crypto_id, datapuller, amount)
+    def signed_amount(self):
+        return self.amount
 
+class Sell(Transaction):
     def value(self):
         return self.amount * self.pointPrice
 
+    def signed_amount(self):
+        return -self.amount
+
 class Portfolio:
-    def __init__(self, startingFunds: float):
+    def __init__(self, startingFunds: float, datapuller: Optional[PullData] = None):
         self._transactions: list[Transaction] = []
+        # Reused for every valuation so its session and cache stay warm
+        self._datapuller = datapuller if datapuller is not None else PullData()
+        # Net amount held per crypto, updated on every transaction
+        self._holdings: Dict[str, int] = {}
         self.funds = startingFunds
         self.portfolio_value = 0
 
     def makeTransaction(self, transaction: Transaction):
+        owned = self._holdings.get(transaction.crypto_id, 0)
         if isinstance(transaction, Sell):
-            owned = self.portfolioHoldings()[transaction.crypto_id]
-            if owned == None or owned <= 0 or owned - transaction.amount < 0:
+            if owned <= 0 or owned - transaction.amount < 0:
                 return f"Cannot sell {transaction.crypto_id}. Ensure you have enough before making sales"
         self._transactions.append(transaction)
         self.funds += transaction.value()
+        self._holdings[transaction.crypto_id] = owned + transaction.signed_amount()
         return "Success"
 
     def seePastTransactions(self) -> None:
-        print(self._transactions)
+        # One line per transaction, written in a single call
+        sys.stdout.write("".join(f"{t!r}\n" for t in self._transactions))
 
     def seeCurrentFunds(self) -> float:
         return round(self.funds, 2)
@@ -269,31 +554,21 @@ class Portfolio:
         if not self._transactions:
             return 0.0
 
-        # Track net amount held for each crypto
-        holdings = self.portfolioHoldings()
+        # Net amount held for each crypto, skipping coins sold off
+        holdings = pd.Series(self._holdings, dtype=float)
+        holdings = holdings[holdings > 0]
+        if holdings.empty:
+            return 0.0
 
-        datapuller = PullData()
-        prices = datapuller.get_current_price(list(holdings.keys()))
-        # Calculate total market value
-        total_value = 0.0
-        for coin, amt in holdings.items():
-            if coin in prices:
-                total_value += prices[coin] * amt
+        # One batched price lookup for every held coin
+        prices = pd.Series(self._datapuller.get_current_price(holdings.index.tolist()), dtype=float)
+        # Multiply aligned on coin id, coins without a price drop out of the sum
+        total_value = (holdings * prices).sum()
 
-        return round(total_value, 2)
+        return round(float(total_value), 2)
     
     def portfolioHoldings(self) -> dict:
-        holdings = {}
-        for t in self._transactions:
-            if t.crypto_id not in holdings:
-                holdings[t.crypto_id] = 0
-
-            # Add or subtract depending on transaction type
-            if isinstance(t, Buy):
-                holdings[t.crypto_id] += t.amount
-            elif isinstance(t, Sell):
-                holdings[t.crypto_id] -= t.amount
-        return holdings
+        return dict(self._holdings)
 
 class MarketData:
     """
@@ -301,10 +576,11 @@ class MarketData:
     Works by Christopher
     """
 
-    def __init__(self, start_currency: str = 'usd'):
+    def __init__(self, start_currency: str = 'usd', ttl: float = 60):
         """
         Args:
             start_currency (str): Currency for price data (Uses USD)
+            ttl (float): Seconds fetched data is reused before refetching
         
         Raises:
             ValueError: If start_currency is invaild or empty
@@ -314,13 +590,19 @@ class MarketData:
 
         self._base_currency = start_currency
         self._data = pd.DataFrame()
+        # Lowercase symbol -> current price, rebuilt on every fetch
+        self._symbol_index = {}
         self._previous_updates = None
         self._api_url = "https://api.coingecko.com/api/v3/coins/markets"
+        self._ttl = ttl
+        self._previous_monotonic = None
+        self._last_limit = 0
+        self._session = _build_session(max_retries=5)
 
     @property
     def data(self):
-        # pd.dataFrame -> Gets current market data
-        return self._data.copy()
+        # pd.dataFrame -> Gets current market data, shared so treat as read-only
+        return self._data
 
     @property
     def previous_update(self) -> bool:
@@ -330,6 +612,9 @@ class MarketData:
     def fetch_data(self, limit: int = 100):
         """
         Fetch Market data from CoinGecko
+
+        Skips the request while the last fetch is younger than the ttl and
+        covered at least as many coins, use invalidate() to force a refresh.
         
         Args:
             limit(int): Num of Crypto to fetch
@@ -343,6 +628,11 @@ class MarketData:
         """
         if not 1<= limit <= 250:
             raise ValueError("Limit must be in 1 - 250")
+
+        if (self._previous_monotonic is not None
+                and time.monotonic() - self._previous_monotonic < self._ttl
+                and self._last_limit >= limit):
+            return True
         
         try:
             params = {
@@ -355,41 +645,50 @@ class MarketData:
             }
 
             print(f"Fetching {limit} Crypto...")
-            response = requests.get(self._api_url, params=params, timeout=10)
+            response = self._session.get(self._api_url, params=params, timeout=10)
 
             if response.status_code == 429:
                 print("Limit Exceed. Please Wait.")
                 return False
             
             response.raise_for_status()
-            data = response.json()
+            # Parse the raw bytes, same as PullData._make_request
+            data = orjson.loads(response.content)
 
             if not data:
                 print("API is empty")
                 return False
             
-            crypto_list = []
+            # One list per column, turned into arrays once at the end
+            columns = {key: [] for key in ('name', 'symbol', 'current_price', 'change_24h',
+                                           'market_cap', 'volume_24h', 'high_24h', 'low_24h')}
             for i in data:
                 if not all(j in i for j in ['name', 'symbol', 'current_price']):
                     continue
 
-                crypto_list.append({
-                    'name': i.get('name', 'Unknown'),
-                    'symbol': i.get('symbol', 'unknown'),
-                    'current_price': i.get('current_price', 0),
-                    'change_24h': i.get('price_change_percentage_24h', 0),
-                    'market_cap': i.get('market_cap', 0),
-                    'volume_24h': i.get('total_volume', 0),
-                    'high_24h': i.get('high_24h', 0),
-                    'low_24h': i.get('low_24h', 0)
-                })
+                columns['name'].append(i.get('name', 'Unknown'))
+                columns['symbol'].append(i.get('symbol', 'unknown'))
+                columns['current_price'].append(i.get('current_price', 0))
+                columns['change_24h'].append(i.get('price_change_percentage_24h', 0))
+                columns['market_cap'].append(i.get('market_cap', 0))
+                columns['volume_24h'].append(i.get('total_volume', 0))
+                columns['high_24h'].append(i.get('high_24h', 0))
+                columns['low_24h'].append(i.get('low_24h', 0))
              
-            if not crypto_list:
+            if not columns['name']:
                 print("No Coin found")
                 return False
 
-            self._data = pd.DataFrame(crypto_list)
+            # Missing (None) numbers become NaN
+            for key in ('current_price', 'change_24h', 'market_cap', 'volume_24h', 'high_24h', 'low_24h'):
+                columns[key] = np.asarray(columns[key], dtype=np.float64)
+            self._data = downcast(pd.DataFrame(columns, copy=False))
+            # Reversed so the first (highest market cap) coin wins a shared symbol
+            self._symbol_index = dict(zip(np.char.lower(self._data['symbol'].to_numpy().astype('U'))[::-1],
+                                          self._data['current_price'].to_numpy()[::-1]))
             self._previous_updates = datetime.now()
+            self._previous_monotonic = time.monotonic()
+            self._last_limit = limit
             print("Successfully fetched")
             return True
         except requests.exceptions.Timeout:
@@ -405,6 +704,15 @@ class MarketData:
             print(f"❌ Unexpected error: {e}")
             return False
 
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._session.close()
+
+    def invalidate(self):
+        """Forget the last fetch so the next fetch_data() hits the API"""
+        self._previous_monotonic = None
+        self._last_limit = 0
+
     def get_crypto_price(self, symbol: str):
         """
         Gets current price for a Specific cyptocurrency
@@ -422,16 +730,24 @@ class MarketData:
         if not symbol or not symbol.strip():
             raise ValueError("Symbol cannot be empty")
         
-        if self._data.empty:
-            return None
-        
-        lower_symbol = symbol.lower().strip()
-        crypto = self._data[self._data['symbol'] == lower_symbol]
-
-        if not crypto.empty:
-            return crypto.iloc[0]['current_price']
-        return None
+        return self._symbol_index.get(symbol.lower().strip())
     
+    def _format_rows(self, df: pd.DataFrame) -> Iterator[str]:
+        """Yield the display_top table, header to closing rule, for the rows of df"""
+        yield TOP_HEADER
+        yield TOP_SEPARATOR
+
+        names = df['name'].astype(str).to_numpy()
+        symbols = np.char.upper(df['symbol'].to_numpy().astype(str))
+        prices = df['current_price'].to_numpy()
+        changes = df['change_24h'].to_numpy(dtype=float)
+
+        for name, symbol, price, change in zip(names, symbols, prices, changes):
+            color, formatted = format_change(change)
+            yield f"{name:<20} {symbol:<10} ${price:>14,.2f} {color}{formatted}{RESET}"
+
+        yield TOP_SEPARATOR
+
     def display_top(self, limit: int = 10):
         """
         Display formatted table of top crypto
@@ -442,31 +758,10 @@ class MarketData:
         if self._data.empty:
             print("No data available")
             return
-        print(f"\n{'Name':<20} {'Symbol':<10} {'Price (USD)':>15} {'24h Change':>15}")
-        print("-" * 70)
-        
-        GREEN = "\033[92m"
-        RED = "\033[91m"
-        RESET = "\033[0m"
-
-        for _, row in self._data.head(limit).iterrows():
-            name = row['name']
-            symbol = row['symbol'].upper()
-            price = row['current_price']
-            change = row['change_24h']
-            
-            if change >= 0:
-                color = GREEN
-                arrow = "▲"
-                sign = "+"
-            else:
-                color = RED
-                arrow = "▼"
-                sign = ""
-            
-            print(f"{name:<20} {symbol:<10} ${price:>14,.2f} {color}{arrow} {sign}{change:.2f}%{RESET}")
-        
-        print("-" * 70)
+
+        # Whole table in one write
+        sys.stdout.write("\n".join(self._format_rows(self._data.head(limit))) + "\n")
+        sys.stdout.flush()
 
 class Portfolio_Helper:
     """
@@ -493,6 +788,33 @@ class Price_Charts_Graphs:
         self._default_figure_size = (12,6)
         self._color_positive = "#2ecc71"
         self._color_negative = "#e74c3c"
+        # Figure and Axes reused by every chart, created on first use
+        self._fig = None
+        self._ax = None
+
+    @staticmethod
+    def _labels(df: pd.DataFrame) -> np.ndarray:
+        """Build 'SYM - Name' bar labels for every row at once"""
+        symbols = np.char.upper(df['symbol'].to_numpy().astype('U'))
+        return np.char.add(np.char.add(symbols, ' - '), df['name'].to_numpy().astype('U'))
+
+    def _axes(self):
+        """
+        Return the shared Figure and Axes, cleared for a new chart
+
+        A new pair is made the first time or after the window was closed.
+        """
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig, self._ax = plt.subplots(figsize=self._default_figure_size)
+        else:
+            self._ax.clear()
+        return self._fig, self._ax
+
+    def close(self):
+        """Release the shared Figure"""
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = self._ax = None
     
     def create_price_chart(self, market_data = MarketData, top_n: int = 10,
                            save_path: Optional[str] = None):
@@ -506,34 +828,34 @@ class Price_Charts_Graphs:
             print("No data available for chart")
             return False
         
+        fig, ax = self._axes()
         try:
-            df = market_data.data.head(top_n).copy()
-            df['label'] = df['symbol'].str.upper() + ' - ' + df['name']
+            # Partial sort, only the top_n highest prices are ordered
+            df = market_data.data.nlargest(top_n, 'current_price')
+            prices = df['current_price'].to_numpy()
             
-            plt.figure(figsize=self._default_figure_size)
-            plt.barh(df['label'], df['current_price'], color='#3498db')
-            plt.xlabel('Price (USD)', fontsize=12, fontweight='bold')
-            plt.ylabel('Cryptocurrency', fontsize=12, fontweight='bold')
-            plt.title(f'Top {top_n} Cryptocurrencies by Price', fontsize=14, fontweight='bold')
-            plt.gca().invert_yaxis()
+            ax.barh(self._labels(df), prices, color='#3498db')
+            ax.set_xlabel('Price (USD)', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Cryptocurrency', fontsize=12, fontweight='bold')
+            ax.set_title(f'Top {top_n} Cryptocurrencies by Price', fontsize=14, fontweight='bold')
+            ax.invert_yaxis()
             
-            for i, price in enumerate(df['current_price']):
-                plt.text(price, i, f' ${price:,.2f}', va='center', fontsize=9)
+            for i, price in enumerate(prices):
+                ax.text(price, i, f' ${price:,.2f}', va='center', fontsize=9)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                fig.savefig(save_path, dpi=300, bbox_inches='tight')
                 print(f"[DONE] Chart saved to {save_path}")
             else:
+                fig.canvas.draw_idle()
                 plt.show()
             
-            plt.close()
             return True
             
         except Exception as e:
             print(f"Error creating chart: {e}")
-            plt.close()
             return False
     
     def create_changing_chart(self, market_data = MarketData, top_n: int = 10,
@@ -551,41 +873,41 @@ class Price_Charts_Graphs:
         if not isinstance(market_data, MarketData):
             raise TypeError("market_data must be a MarketData instance")
         
+        if not 1 <= top_n <= 50:
+            raise ValueError("top_n must be between 1 and 50")
+        
         if market_data.data.empty:
             print("[ERROR]No data available for chart")
             return False
         
+        fig, ax = self._axes()
         try:
-            df = market_data.data.head(top_n).copy()
-            df['label'] = df['symbol'].str.upper() + ' - ' + df['name']
+            df = market_data.data.head(top_n)
+            changes = df['change_24h'].to_numpy()
             
-            colors = [self._color_positive if x >= 0 else self._color_negative 
-                     for x in df['change_24h']]
+            colors = np.where(changes >= 0, self._color_positive, self._color_negative)
             
-            plt.figure(figsize=self._default_figure_size)
-            plt.barh(df['label'], df['change_24h'], color=colors)
-            plt.xlabel('24h Change (%)', fontsize=12, fontweight='bold')
-            plt.ylabel('Cryptocurrency', fontsize=12, fontweight='bold')
-            plt.title(f'24-Hour Price Changes - Top {top_n}', fontsize=14, fontweight='bold')
-            plt.gca().invert_yaxis()
-            plt.axvline(x=0, color='black', linestyle='-', linewidth=0.8)
+            ax.barh(self._labels(df), changes, color=colors)
+            ax.set_xlabel('24h Change (%)', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Cryptocurrency', fontsize=12, fontweight='bold')
+            ax.set_title(f'24-Hour Price Changes - Top {top_n}', fontsize=14, fontweight='bold')
+            ax.invert_yaxis()
+            ax.axvline(x=0, color='black', linestyle='-', linewidth=0.8)
             
-            for i, change in enumerate(df['change_24h']):
-                sign = '+' if change >= 0 else ''
-                plt.text(change, i, f' {sign}{change:.2f}%', va='center', fontsize=9)
+            for i, change in enumerate(changes):
+                ax.text(change, i, f' {change:+.2f}%', va='center', fontsize=9)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             if save_path:
-                plt.savefig(save_path, dpi=300, bbox_inches='tight')
+                fig.savefig(save_path, dpi=300, bbox_inches='tight')
                 print(f"[DONE] Chart saved to {save_path}")
             else:
+                fig.canvas.draw_idle()
                 plt.show()
             
-            plt.close()
             return True
             
         except Exception as e:
             print(f"Error creating chart: {e}")
-            plt.close()
             return False
\ No newline at end of file
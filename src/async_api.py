@@ -0,0 +1,204 @@
+import asyncio
+import time
+import httpx
+import pandas as pd
+from typing import Dict, List, Optional
+
+from .api_library import CoinGeckoBase, _cached, orjson
+
+
+class _AsyncRateLimiter:
+    """Token bucket allowing max_rate requests per time_period seconds"""
+
+    def __init__(self, max_rate: float, time_period: float):
+        self._capacity = max_rate
+        self._tokens = max_rate
+        self._refill_rate = max_rate / time_period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._updated) * self._refill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+
+class AsyncPullData(CoinGeckoBase):
+    """
+    Asynchronous version of PullData for fetching many endpoints at once
+
+    Every getter is a coroutine sharing one httpx.AsyncClient, so lookups
+    started together with asyncio.gather overlap their round-trips. Results
+    go through the same response cache as PullData, but it is not a PullData
+    and can't be passed where one is expected.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, concurrency_limit: int = 10,
+                 requests_per_minute: int = 30):
+        """
+        Args:
+            client: AsyncClient to send requests with, one is created if None
+            concurrency_limit: Max requests in flight at once
+            requests_per_minute: Request budget, CoinGecko's free tier allows 30
+        """
+        super().__init__()
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=60, limits=httpx.Limits(max_connections=concurrency_limit))
+        self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._limiter = _AsyncRateLimiter(requests_per_minute, 60)
+
+    async def aclose(self):
+        """Close the AsyncClient if this instance created it"""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
+        """
+        Make a rate-limited request to the API without blocking the event loop
+
+        429 responses are retried up to max_retries times.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary
+        """
+        url = f"{self.url}/{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            await self._limiter.acquire()
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(url, params=params)
+                if response.status_code == 429:  # Too Many Requests
+                    if attempt == self.max_retries:
+                        break
+                    wait = self._retry_wait(response, attempt)
+                    print(f"429 received — retrying in {wait:.1f}s...")
+                    await asyncio.sleep(wait)
+                    continue
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            except httpx.HTTPError as e:
+                print(f"API request failed: {e}")
+                return None
+            except ValueError as e:
+                print(f"API returned invalid JSON: {e}")
+                return None
+
+        print("Exceeded retry limit after rate limiting")
+        return None
+
+    @_cached(ttl=60)
+    async def _market_rows(self, page: int = 1) -> List[Dict]:
+        """Raw coins/markets rows, cached once for both market getters"""
+        return await self._make_request("coins/markets", self._market_params(page))
+
+    async def get_market_data(self, page: int = 1) -> pd.DataFrame:
+        """
+        Get current market data for multiple cryptocurrencies
+
+        Args:
+            page: Page number
+
+        Returns:
+            DataFrame with market data
+        """
+        return self._parse_market_data(await self._market_rows(page))
+
+    async def get_market_data_arrays(self, page: int = 1):
+        """
+        Get the chart columns of the market data as NumPy arrays
+
+        Shares its cached response with get_market_data().
+
+        Args:
+            page: Page number
+
+        Returns:
+            Tuple of (symbols, prices, change_24h) arrays
+        """
+        return self._parse_market_arrays(await self._market_rows(page))
+
+    @_cached(ttl=300)
+    async def get_crypto_details(self, crypto_id: str) -> Dict:
+        """
+        Get detailed information about a specific cryptocurrency
+
+        Args:
+            crypto_id: CoinGecko ID (e.g., 'bitcoin', 'ethereum')
+
+        Returns:
+            Dictionary with crypto details including description
+        """
+        data = await self._make_request(f"coins/{crypto_id}")
+        return self._parse_crypto_details(data)
+
+    @_cached(ttl=3600)
+    async def get_historical_data(self, crypto_id: str, days: int = 30) -> pd.DataFrame:
+        """
+        Get historical price data for a cryptocurrency
+
+        Args:
+            crypto_id: CoinGecko ID (e.g., 'bitcoin', 'ethereum')
+            days: Number of days of historical data (max 365)
+
+        Returns:
+            DataFrame with timestamp and price columns
+        """
+        data = await self._make_request(f"coins/{crypto_id}/market_chart", self._historical_params(days))
+        return self._parse_historical_data(data)
+
+    async def get_many_historical(self, crypto_ids: List[str], days: int = 30) -> Dict[str, pd.DataFrame]:
+        """
+        Get historical price data for several cryptocurrencies concurrently
+
+        Args:
+            crypto_ids: List of CoinGecko IDs
+            days: Number of days of historical data (max 365)
+
+        Returns:
+            Dictionary mapping crypto_id to its history DataFrame
+        """
+        frames = await asyncio.gather(*[self.get_historical_data(i, days) for i in crypto_ids])
+        return dict(zip(crypto_ids, frames))
+
+    @_cached(ttl=30)
+    async def get_current_price(self, crypto_ids: List[str], vs_currency: str = "usd") -> Dict:
+        """
+        Get current prices for multiple cryptocurrencies
+
+        Batches of max_ids_per_request are fetched concurrently.
+
+        Args:
+            crypto_ids: List of CoinGecko IDs
+            vs_currency: Currency to compare against
+
+        Returns:
+            Dictionary mapping crypto_id to price
+        """
+        responses = await asyncio.gather(*[
+            self._make_request("simple/price", self._price_params(batch, vs_currency))
+            for batch in self._price_batches(crypto_ids)
+        ])
+
+        prices = {}
+        for data in responses:
+            prices.update(self._parse_current_price(data, vs_currency))
+        return prices
@@ -1,5 +1,72 @@
+import sys
+from typing import Iterator, Tuple
+import numpy as np
 import pandas as pd
 
+# Text columns that repeat across coins, stored as category. id and name are
+# unique per row, so a category would only add a codes array on top of them
+CATEGORY_COLUMNS = ("symbol",)
+# Large totals where float32's ~7 significant digits are enough. Prices stay
+# float64 so lookups return exactly what the API sent
+FLOAT32_COLUMNS = ("market_cap", "total_volume", "volume_24h")
+
+# ANSI colors for price changes
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+
+def format_change(change: float) -> Tuple[str, str]:
+    """
+    Pick the color and text for a 24h change cell
+
+    Args:
+        change (float): Percent change, NaN when the API had none
+
+    Returns:
+        tuple: (ANSI color, text such as "▲ +2.50%" or "N/A")
+    """
+    if np.isnan(change):
+        return RESET, "N/A"
+    if change >= 0:
+        return GREEN, f"▲ +{change:.2f}%"
+    return RED, f"▼ {change:.2f}%"
+
+
+# Market table layout, formatted once at import
+_ROW_FMT = "{:<20} {:<10} {:>12,.2f} {}{:>12}{}"
+_HEADER = "\n{:<20} {:<10} {:>12} {:>12}".format("Name", "Symbol", "Price (USD)", "24h Change")
+_SEPARATOR = "-" * 60
+
+# MarketData.display_top table layout
+TOP_HEADER = f"\n{'Name':<20} {'Symbol':<10} {'Price (USD)':>15} {'24h Change':>15}"
+TOP_SEPARATOR = "-" * 70
+
+
+def downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a market DataFrame in place to the smallest practical dtypes
+
+    Market cap and volume floats become float32, integers the smallest int
+    that fits, and the symbol column becomes a category.
+
+    Args:
+        df (pd.DataFrame): Frame fresh from the API
+
+    Returns:
+        pd.DataFrame: The same frame, downcast
+    """
+    # Explicit cast, to_numeric(downcast="float") refuses any precision loss
+    for column in df.select_dtypes("float").columns.intersection(FLOAT32_COLUMNS):
+        df[column] = df[column].astype(np.float32)
+    for column in df.select_dtypes("integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
 class CryptoMarketDisplay:
     """
     Class for displaying cryptocurrency market data in formatted UI.
@@ -13,7 +80,8 @@ class CryptoMarketDisplay:
         Initialize display with market data.
 
         Args:
-            market_data (pd.DataFrame): Output from PullData.get_market_data()
+            market_data (pd.DataFrame): Output from PullData.get_market_data(),
+                kept by reference so it shouldn't be modified afterwards
 
         Raises:
             TypeError: If input is not a pandas DataFrame
@@ -21,12 +89,26 @@ class CryptoMarketDisplay:
         if not isinstance(market_data, pd.DataFrame):
             raise TypeError("market_data must be a pandas DataFrame")
 
-        self._data = market_data.copy()
+        self._data = market_data
 
     @property
     def data(self):
-        """Return market DataFrame (read-only)"""
-        return self._data.copy()
+        """Return market DataFrame (shared, treat as read-only)"""
+        return self._data
+
+    def _format_rows(self, df: pd.DataFrame) -> Iterator[str]:
+        """Yield the table header and one colored line per coin in df."""
+        yield _HEADER
+        yield _SEPARATOR
+
+        names = df["name"].astype(str).to_numpy()
+        symbols = np.char.upper(df["symbol"].to_numpy().astype(str))
+        prices = df["current_price"].to_numpy()
+        changes = df["change_24h"].to_numpy(dtype=float)
+
+        for name, symbol, price, change in zip(names, symbols, prices, changes):
+            color, formatted = format_change(change)
+            yield _ROW_FMT.format(name, symbol, price, color, formatted, RESET)
 
     def display_market_data(self, limit: int = 10) -> None:
         """Display formatted crypto list with arrows & color."""
@@ -36,32 +118,9 @@ class CryptoMarketDisplay:
             print("⚠️  No data available to display.")
             return
 
-        print("\n{:<20} {:<10} {:>12} {:>12}".format("Name", "Symbol", "Price (USD)", "24h Change"))
-        print("-" * 60)
-
-        GREEN = "\033[92m"
-        RED = "\033[91m"
-        RESET = "\033[0m"
-
-        for _, row in df.head(limit).iterrows():
-            name = row["name"]
-            symbol = row["symbol"].upper()
-            price = row["current_price"]
-            change = row["change_24h"]
-
-            if pd.isna(change):
-                color = RESET
-                formatted_change = "N/A"
-            elif change > 0:
-                color = GREEN
-                formatted_change = f"▲ +{change:.2f}%"
-            else:
-                color = RED
-                formatted_change = f"▼ {change:.2f}%"
-
-            print("{:<20} {:<10} {:>12,.2f} {}{:>12}{}".format(
-                name, symbol, price, color, formatted_change, RESET
-            ))
+        # Whole table in one write
+        sys.stdout.write("\n".join(self._format_rows(df.head(limit))) + "\n")
+        sys.stdout.flush()
 
     def summarize_market_performance(self):
         """Print top gainer and loser."""
@@ -71,8 +130,14 @@ class CryptoMarketDisplay:
             print("⚠️  No data available for summary.")
             return
 
-        top_gainer = df.loc[df["change_24h"].idxmax()]
-        top_loser = df.loc[df["change_24h"].idxmin()]
+        changes = df["change_24h"].to_numpy(dtype=float)
+        if np.isnan(changes).all():
+            print("⚠️  No 24h changes available for summary.")
+            return
+
+        # Positions, not labels, so any index works
+        top_gainer = df.iloc[int(np.nanargmax(changes))]
+        top_loser = df.iloc[int(np.nanargmin(changes))]
 
         print("\n📈 Market Performance Summary")
         print("-" * 40)